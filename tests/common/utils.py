@@ -18,7 +18,9 @@ Utility functions for tests.
 
 import sys
 import os
+import re
 import logging
+import functools
 from dateutil import tz
 
 import zhmcclient
@@ -504,6 +506,22 @@ def timestamp_aware(dt):
     return dt
 
 
+@functools.lru_cache(maxsize=None)
+def _blanked_properties_pattern(blanked_properties):
+    """
+    Return a compiled regexp pattern that matches any of the specified
+    properties with a blanked out value, in a string representation of a
+    properties dict. The property name is captured as group 1.
+
+    Parameters:
+        blanked_properties (frozenset of str): The names of the properties
+          (with hyphened names).
+    """
+    names = '|'.join(re.escape(pname) for pname in sorted(blanked_properties))
+    blanked = re.escape(zhmcclient.BLANKED_OUT_STRING)
+    return re.compile(f"'({names})': '{blanked}'")
+
+
 def assert_blanked_in_message(message, properties, blanked_properties):
     """
     Assert that a message containing a string representation of a properties
@@ -513,10 +531,16 @@ def assert_blanked_in_message(message, properties, blanked_properties):
         message (str): The message to be checked.
         properties (dict): Properties that can possibly be in the message
           (with hyphened names).
-        blanked_properties (list of str): The names of the properties that
+        blanked_properties (iterable of str): The names of the properties that
           need to be blanked out in the message (with hyphened names).
     """
-    for pname in blanked_properties:
-        if pname in properties:
-            exp_str = f"'{pname}': '{zhmcclient.BLANKED_OUT_STRING}'"
-            assert message.find(exp_str) > 0
+    blanked_properties = frozenset(blanked_properties)
+    exp_pnames = blanked_properties.intersection(properties)
+    if not exp_pnames:
+        return
+    pattern = _blanked_properties_pattern(blanked_properties)
+    pnames = {m.group(1) for m in pattern.finditer(message)}
+    missing_pnames = exp_pnames - pnames
+    assert not missing_pnames, (
+        f"Properties {sorted(missing_pnames)!r} are not blanked out in "
+        f"message: {message!r}")
@@ -18,8 +18,8 @@ Unit tests for _partition module.
 
 
 import re
-import copy
 import logging
+from types import SimpleNamespace
 import pytest
 
 from zhmcclient import Client, Partition, HTTPError, NotFound
@@ -36,110 +36,293 @@ PART3_NAME = 'part 3'
 
 CPC_NAME = 'fake-cpc1-name'
 
+# Properties of our faked partitions. The faked partition manager copies
+# them when adding a faked partition, so they can be passed in directly.
+PART1_PROPS = {
+    'object-id': PART1_OID,
+    # object-uri and parent will be automatically set
+    'class': 'partition',
+    'name': PART1_NAME,
+    'description': 'Partition #1',
+    'status': 'active',
+    'type': 'linux',
+    'ifl-processors': 2,
+    'initial-memory': 4096,
+    'maximum-memory': 8192,
+}
+PART2_PROPS = {
+    'object-id': PART2_OID,
+    # object-uri and parent will be automatically set
+    'class': 'partition',
+    'name': PART2_NAME,
+    'description': 'Partition #2',
+    'status': 'active',
+    'type': 'ssc',
+    'ifl-processors': 2,
+    'initial-memory': 4096,
+    'maximum-memory': 8192,
+}
+PART3_PROPS = {
+    'object-id': PART3_OID,
+    # object-uri and parent will be automatically set
+    'class': 'partition',
+    'name': PART3_NAME,
+    'description': 'Partition #3',
+    'status': 'active',
+    'type': 'linux',
+    'ifl-processors': 2,
+    'initial-memory': 4096,
+    'maximum-memory': 8192,
+    'available-features-list': [],
+}
+
 # Properties returned by default from list_permitted_partitions()
-LIST_PERMITTED_PARTITIONS_PROPS = [
+LIST_PERMITTED_PARTITIONS_PROPS = (
     'name', 'object-uri', 'type', 'status', 'has-unacceptable-status',
     'cpc-name', 'cpc-object-uri',
     # The zhmcclient_mock support always returns 'se-version'
     'se-version'
-]
+)
+
+# Additional properties requested in the list_permitted_partitions() testcases
+ADDITIONAL_PROPS_CPU_MEM = ('ifl-processors', 'maximum-memory')
+ADDITIONAL_PROPS_MEM = ('maximum-memory',)
+
+# Properties whose values are blanked out in the API log records
+BLANKED_PROPS = frozenset(('boot-ftp-password', 'ssc-master-pw'))
+
+# Items of the 'available-features-list' property used in the firmware feature
+# testcases. The tests set the property to lists containing these items, but
+# never modify the items, so they can be shared between testcases.
+FEATURE_FOO_ENABLED = {'name': 'fake-feature-foo', 'state': True}
+FEATURE_BAR_DISABLED = {'name': 'fake-feature-bar', 'state': False}
+FEATURE1_ENABLED = {'name': 'fake-feature1', 'state': True}
+FEATURE1_DISABLED = {'name': 'fake-feature1', 'state': False}
+
+# Patterns for the exception messages expected in the firmware feature tests
+FEATURES_NOT_SUPPORTED_PATTERN = re.compile(
+    "Firmware features are not supported")
+FEATURE1_NOT_AVAILABLE_PATTERN = re.compile(
+    "Firmware feature fake-feature1 is not available")
+
+# Begin of the string returned by Partition.__repr__(), with newlines escaped
+PARTITION_REPR_PATTERN = re.compile(
+    r'^(?P<cls>\w+)\s+at\s+0x(?P<id>[0-9a-f]+)\s+\(\\n')
+
+
+@pytest.fixture(scope='module')
+def hmc_env():
+    """
+    Fixture that sets up a faked session, and adds a faked CPC in DPM mode
+    without any child resources.
+
+    This is done only once per test module, because constructing the faked
+    HMC is much more expensive than the tests themselves.
+
+    Returns:
+      SimpleNamespace with attributes session, client, faked_cpc, cpc.
+    """
+    session = FakedSession('fake-host', 'fake-hmc', '2.13.1', '1.8')
+    client = Client(session)
+
+    faked_cpc = session.hmc.cpcs.add({
+        'object-id': 'fake-cpc1-oid',
+        # object-uri is set up automatically
+        'parent': None,
+        'class': 'cpc',
+        'name': CPC_NAME,
+        'description': 'CPC #1 (DPM mode)',
+        'status': 'active',
+        'dpm-enabled': True,
+        'is-ensemble-member': False,
+        'iml-mode': 'dpm',
+    })
+    cpc = client.cpcs.find(name=CPC_NAME)
+
+    return SimpleNamespace(
+        session=session, client=client, faked_cpc=faked_cpc, cpc=cpc)
+
+
+@pytest.fixture(scope='module')
+def hmc_console(hmc_env):
+    """
+    Fixture that adds a faked console to the faked HMC of the module and
+    returns the Console object for it.
+
+    This is done only once per test module, because the faked HMC supports
+    only a single console.
+    """
+    # pylint: disable=redefined-outer-name
+    hmc_env.session.hmc.consoles.add({
+        'object-id': None,
+        # object-uri will be automatically set
+        'parent': None,
+        'class': 'console',
+        'name': 'fake-console1',
+        'description': 'Console #1',
+    })
+    return hmc_env.client.consoles.console
+
+
+@pytest.fixture(scope='module', autouse=True)
+def quiet_api_logger():
+    """
+    Fixture that sets the level of the API logger to WARNING for the tests in
+    this module, and restores its previous level afterwards.
+
+    This ensures that the API calls do not produce debug log records, unless
+    a test enables them via caplog.set_level() because it checks them.
+    """
+    logger = logging.getLogger("zhmcclient.api")
+    saved_level = logger.level
+    logger.setLevel(logging.WARNING)
+    yield
+    logger.setLevel(saved_level)
+
+
+def find_api_call_record(records, apifunc_str):
+    """
+    Return the most recent log record of the API logger for a call to the
+    specified API function (e.g. 'Partition.update_properties()').
+    """
+    prefix = f"Called: {apifunc_str},"
+    for record in reversed(records):
+        if record.name == "zhmcclient.api" and \
+                record.getMessage().startswith(prefix):
+            return record
+    raise AssertionError(
+        f"No API call log record found for {apifunc_str}")
+
+
+def add_or_lookup_partition(faked_cpc, properties):
+    """
+    Add a faked partition to the faked CPC, or return the existing faked
+    partition if one with the same object ID has already been added.
+    """
+    try:
+        return faked_cpc.partitions.lookup_by_oid(properties['object-id'])
+    except KeyError:
+        return faked_cpc.partitions.add(properties)
+
+
+def add_partition1(faked_cpc):
+    """Add partition 1 (type linux)."""
+    return add_or_lookup_partition(faked_cpc, PART1_PROPS)
+
+
+def add_partition2(faked_cpc):
+    """Add partition 2 (type ssc)."""
+    return add_or_lookup_partition(faked_cpc, PART2_PROPS)
+
+
+def add_partition3(faked_cpc):
+    """Add partition 3 (support for firmware features)."""
+    return add_or_lookup_partition(faked_cpc, PART3_PROPS)
+
+
+# Functions for adding the faked partitions, by partition name
+ADD_PARTITION_FUNCS = {
+    PART1_NAME: add_partition1,
+    PART2_NAME: add_partition2,
+    PART3_NAME: add_partition3,
+}
+
+
+def add_partition(faked_cpc, part_name):
+    """Add a partition (using one of the known names)."""
+    return ADD_PARTITION_FUNCS[part_name](faked_cpc)
 
 
 class TestPartition:
     """All tests for the Partition and PartitionManager classes."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_partitions(self, hmc_env):
         """
-        Setup that is called by pytest before each test method.
+        Setup and teardown that is called by pytest around each test method.
 
-        Set up a faked session, and add a faked CPC in DPM mode without any
-        child resources.
+        Make the module-wide faked session and CPC available to the test
+        method, and remove any faked partitions the test method has added to
+        the faked CPC.
         """
-        # pylint: disable=attribute-defined-outside-init
-
-        self.session = FakedSession('fake-host', 'fake-hmc', '2.13.1', '1.8')
-        self.client = Client(self.session)
-
-        self.faked_cpc = self.session.hmc.cpcs.add({
-            'object-id': 'fake-cpc1-oid',
-            # object-uri is set up automatically
-            'parent': None,
-            'class': 'cpc',
-            'name': CPC_NAME,
-            'description': 'CPC #1 (DPM mode)',
-            'status': 'active',
-            'dpm-enabled': True,
-            'is-ensemble-member': False,
-            'iml-mode': 'dpm',
-        })
-        self.cpc = self.client.cpcs.find(name=CPC_NAME)
-
-    def add_partition1(self):
-        """Add partition 1 (type linux)."""
-
-        faked_partition = self.faked_cpc.partitions.add({
-            'object-id': PART1_OID,
-            # object-uri will be automatically set
-            'parent': self.faked_cpc.uri,
-            'class': 'partition',
-            'name': PART1_NAME,
-            'description': 'Partition #1',
-            'status': 'active',
-            'type': 'linux',
-            'ifl-processors': 2,
-            'initial-memory': 4096,
-            'maximum-memory': 8192,
-        })
-        return faked_partition
-
-    def add_partition2(self):
-        """Add partition 2 (type ssc)."""
-
-        faked_partition = self.faked_cpc.partitions.add({
-            'object-id': PART2_OID,
-            # object-uri will be automatically set
-            'parent': self.faked_cpc.uri,
-            'class': 'partition',
-            'name': PART2_NAME,
-            'description': 'Partition #2',
-            'status': 'active',
-            'type': 'ssc',
-            'ifl-processors': 2,
-            'initial-memory': 4096,
-            'maximum-memory': 8192,
-        })
-        return faked_partition
-
-    def add_partition3(self):
-        """Add partition 3 (support for firmware features)."""
-
-        faked_partition = self.faked_cpc.partitions.add({
-            'object-id': PART3_OID,
-            # object-uri will be automatically set
-            'parent': self.faked_cpc.uri,
-            'class': 'partition',
-            'name': PART3_NAME,
-            'description': 'Partition #3',
-            'status': 'active',
-            'type': 'linux',
-            'ifl-processors': 2,
-            'initial-memory': 4096,
-            'maximum-memory': 8192,
-            'available-features-list': [],
-        })
-        return faked_partition
+        # pylint: disable=attribute-defined-outside-init,redefined-outer-name
+
+        self.session = hmc_env.session
+        self.faked_cpc = hmc_env.faked_cpc
+        self.cpc = hmc_env.cpc
+        self.partition_mgr = self.cpc.partitions
+
+        faked_partitions = self.faked_cpc.partitions
+        saved_oids = {p.oid for p in faked_partitions.list()}
 
-    def add_partition(self, part_name):
-        """Add a partition (using one of the known names)."""
+        yield
 
-        if part_name == PART1_NAME:
-            faked_partition = self.add_partition1()
-        elif part_name == PART2_NAME:
-            faked_partition = self.add_partition2()
+        for faked_partition in faked_partitions.list():
+            if faked_partition.oid not in saved_oids:
+                faked_partitions.remove(faked_partition.oid)
+
+        # Removed or renamed partitions must not be found via the client's
+        # name-to-URI cache in subsequent tests.
+        self.partition_mgr.invalidate_cache()
+
+    @pytest.fixture
+    def faked_partition(self, request):
+        """
+        Fixture that adds a faked partition and returns it.
+
+        The name of the partition (one of the known names) is specified as an
+        indirect parameter, e.g.:
+
+            @pytest.mark.parametrize(
+                "faked_partition", [PART1_NAME], indirect=True)
+        """
+        return add_partition(self.faked_cpc, request.param)
+
+    @pytest.fixture
+    def faked_partition1(self):
+        """Fixture that adds faked partition 1 and returns it."""
+        return add_partition1(self.faked_cpc)
+
+    @pytest.fixture
+    def faked_partition2(self):
+        """Fixture that adds faked partition 2 and returns it."""
+        return add_partition2(self.faked_cpc)
+
+    @pytest.fixture
+    def both_partitions(self, faked_partition1, faked_partition2):
+        """
+        Fixture that adds faked partitions 1 and 2 and returns them as a
+        list.
+        """
+        # pylint: disable=no-self-use
+        return [faked_partition1, faked_partition2]
+
+    def get_partition(self, faked_partition):
+        """
+        Return the Partition object for a faked partition, without looking it
+        up on the faked HMC.
+        """
+        return self.partition_mgr.resource_object(faked_partition.oid)
+
+    @pytest.fixture
+    def feature_partition(self, faked_partition, available_features):
+        """
+        Fixture that sets up the firmware feature list of the faked partition
+        from the 'faked_partition' fixture, and returns its Partition object.
+
+        The firmware feature list is specified as a test parameter named
+        'available_features'. If it is None, the faked partition will not have
+        the 'available-features-list' property.
+        """
+
+        # Set up the firmware feature list
+        if available_features is not None:
+            faked_partition.properties['available-features-list'] = \
+                available_features
         else:
-            assert part_name == PART3_NAME
-            faked_partition = self.add_partition3()
-        return faked_partition
+            faked_partition.properties.pop('available-features-list', None)
+
+        return self.get_partition(faked_partition)
 
     def test_pm_initial_attrs(self):
         """Test initial attributes of PartitionManager."""
@@ -157,162 +340,201 @@ class TestPartition:
     @pytest.mark.parametrize(
         "full_properties_kwargs, prop_names", [
             ({},
-             ['object-uri', 'name', 'status']),
+             ('object-uri', 'name', 'status')),
             (dict(full_properties=False),
-             ['object-uri', 'name', 'status']),
+             ('object-uri', 'name', 'status')),
             (dict(full_properties=True),
              None),
         ]
     )
     def test_pm_list_full_properties(
-            self, full_properties_kwargs, prop_names):
+            self, both_partitions, full_properties_kwargs, prop_names):
         """Test PartitionManager.list() with full_properties."""
 
-        # Add two faked partitions
-        faked_partition1 = self.add_partition1()
-        faked_partition2 = self.add_partition2()
-
-        exp_faked_partitions = [faked_partition1, faked_partition2]
-        partition_mgr = self.cpc.partitions
-
         # Execute the code to be tested
-        partitions = partition_mgr.list(**full_properties_kwargs)
-
-        assert_resources(partitions, exp_faked_partitions, prop_names)
-
+        partitions = self.partition_mgr.list(**full_properties_kwargs)
+
+        assert_resources(partitions, both_partitions, prop_names)
+
+    # The ids of the testcases indicate the kind of filter value:
+    # - 'exact': A single filter argument with a string value without regexp
+    #   special characters, for which PartitionManager.list() performs a
+    #   direct lookup by name or object ID.
+    # - 'regex': A single string value with regexp special characters, which
+    #   is matched as a regular expression.
+    # - 'list': A list of values, each of which is matched.
+    # Testcases with multiple filter arguments have a 'name-oid' prefix.
+    # This allows selecting these kinds of testcases with 'pytest -k'.
     @pytest.mark.parametrize(
         "filter_args, exp_names", [
-            ({'object-id': PART1_OID},
-             [PART1_NAME]),
-            ({'object-id': PART2_OID},
-             [PART2_NAME]),
-            ({'object-id': [PART1_OID, PART2_OID]},
-             [PART1_NAME, PART2_NAME]),
-            ({'object-id': [PART1_OID, PART1_OID]},
-             [PART1_NAME]),
-            ({'object-id': PART1_OID + 'foo'},
-             []),
-            ({'object-id': [PART1_OID, PART2_OID + 'foo']},
-             [PART1_NAME]),
-            ({'object-id': [PART2_OID + 'foo', PART1_OID]},
-             [PART1_NAME]),
-            ({'name': PART1_NAME},
-             [PART1_NAME]),
-            ({'name': PART2_NAME},
-             [PART2_NAME]),
-            ({'name': [PART1_NAME, PART2_NAME]},
-             [PART1_NAME, PART2_NAME]),
-            ({'name': PART1_NAME + 'foo'},
-             []),
-            ({'name': [PART1_NAME, PART2_NAME + 'foo']},
-             [PART1_NAME]),
-            ({'name': [PART2_NAME + 'foo', PART1_NAME]},
-             [PART1_NAME]),
-            ({'name': [PART1_NAME, PART1_NAME]},
-             [PART1_NAME]),
-            ({'name': '.*part 1'},
-             [PART1_NAME]),
-            ({'name': 'part 1.*'},
-             [PART1_NAME]),
-            ({'name': 'part .'},
-             [PART1_NAME, PART2_NAME]),
-            ({'name': '.art 1'},
-             [PART1_NAME]),
-            ({'name': '.+'},
-             [PART1_NAME, PART2_NAME]),
-            ({'name': 'part 1.+'},
-             []),
-            ({'name': '.+part 1'},
-             []),
-            ({'name': PART1_NAME,
-              'object-id': PART1_OID},
-             [PART1_NAME]),
-            ({'name': PART1_NAME,
-              'object-id': PART1_OID + 'foo'},
-             []),
-            ({'name': PART1_NAME + 'foo',
-              'object-id': PART1_OID},
-             []),
-            ({'name': PART1_NAME + 'foo',
-              'object-id': PART1_OID + 'foo'},
-             []),
+            pytest.param(
+                {'object-id': PART1_OID},
+                [PART1_NAME],
+                id='oid-exact-part1'),
+            pytest.param(
+                {'object-id': PART2_OID},
+                [PART2_NAME],
+                id='oid-exact-part2'),
+            pytest.param(
+                {'object-id': [PART1_OID, PART2_OID]},
+                [PART1_NAME, PART2_NAME],
+                id='oid-list-part1-part2'),
+            pytest.param(
+                {'object-id': [PART1_OID, PART1_OID]},
+                [PART1_NAME],
+                id='oid-list-part1-twice'),
+            pytest.param(
+                {'object-id': PART1_OID + 'foo'},
+                [],
+                id='oid-exact-nomatch'),
+            pytest.param(
+                {'object-id': [PART1_OID, PART2_OID + 'foo']},
+                [PART1_NAME],
+                id='oid-list-part1-nomatch'),
+            pytest.param(
+                {'object-id': [PART2_OID + 'foo', PART1_OID]},
+                [PART1_NAME],
+                id='oid-list-nomatch-part1'),
+            pytest.param(
+                {'name': PART1_NAME},
+                [PART1_NAME],
+                id='name-exact-part1'),
+            pytest.param(
+                {'name': PART2_NAME},
+                [PART2_NAME],
+                id='name-exact-part2'),
+            pytest.param(
+                {'name': [PART1_NAME, PART2_NAME]},
+                [PART1_NAME, PART2_NAME],
+                id='name-list-part1-part2'),
+            pytest.param(
+                {'name': PART1_NAME + 'foo'},
+                [],
+                id='name-exact-nomatch'),
+            pytest.param(
+                {'name': [PART1_NAME, PART2_NAME + 'foo']},
+                [PART1_NAME],
+                id='name-list-part1-nomatch'),
+            pytest.param(
+                {'name': [PART2_NAME + 'foo', PART1_NAME]},
+                [PART1_NAME],
+                id='name-list-nomatch-part1'),
+            pytest.param(
+                {'name': [PART1_NAME, PART1_NAME]},
+                [PART1_NAME],
+                id='name-list-part1-twice'),
+            pytest.param(
+                {'name': '.*part 1'},
+                [PART1_NAME],
+                id='name-regex-any-prefix'),
+            pytest.param(
+                {'name': 'part 1.*'},
+                [PART1_NAME],
+                id='name-regex-any-suffix'),
+            pytest.param(
+                {'name': 'part .'},
+                [PART1_NAME, PART2_NAME],
+                id='name-regex-one-char-suffix'),
+            pytest.param(
+                {'name': '.art 1'},
+                [PART1_NAME],
+                id='name-regex-one-char-prefix'),
+            pytest.param(
+                {'name': '.+'},
+                [PART1_NAME, PART2_NAME],
+                id='name-regex-all'),
+            pytest.param(
+                {'name': 'part 1.+'},
+                [],
+                id='name-regex-nomatch-suffix'),
+            pytest.param(
+                {'name': '.+part 1'},
+                [],
+                id='name-regex-nomatch-prefix'),
+            pytest.param(
+                {'name': PART1_NAME,
+                 'object-id': PART1_OID},
+                [PART1_NAME],
+                id='name-oid-part1'),
+            pytest.param(
+                {'name': PART1_NAME,
+                 'object-id': PART1_OID + 'foo'},
+                [],
+                id='name-oid-nomatch-oid'),
+            pytest.param(
+                {'name': PART1_NAME + 'foo',
+                 'object-id': PART1_OID},
+                [],
+                id='name-oid-nomatch-name'),
+            pytest.param(
+                {'name': PART1_NAME + 'foo',
+                 'object-id': PART1_OID + 'foo'},
+                [],
+                id='name-oid-nomatch-both'),
         ]
     )
-    def test_pm_list_filter_args(self, filter_args, exp_names):
+    def test_pm_list_filter_args(self, both_partitions, filter_args,
+                                 exp_names):
         """Test PartitionManager.list() with filter_args."""
-
-        # Add two faked partitions
-        self.add_partition1()
-        self.add_partition2()
-
-        partition_mgr = self.cpc.partitions
+        # pylint: disable=unused-argument
 
         # Execute the code to be tested
-        partitions = partition_mgr.list(filter_args=filter_args)
+        partitions = self.partition_mgr.list(filter_args=filter_args)
 
         assert len(partitions) == len(exp_names)
-        if exp_names:
-            names = [p.properties['name'] for p in partitions]
-            assert set(names) == set(exp_names)
+        assert sorted(p.properties['name'] for p in partitions) == \
+            sorted(exp_names)
 
     @pytest.mark.parametrize(
         "list_kwargs, prop_names", [
             ({},
-             ['object-uri', 'name', 'status']),
+             ('object-uri', 'name', 'status')),
             (dict(additional_properties=[]),
-             ['object-uri', 'name', 'status']),
+             ('object-uri', 'name', 'status')),
             (dict(additional_properties=['description']),
-             ['object-uri', 'name', 'status', 'description']),
+             ('object-uri', 'name', 'status', 'description')),
             (dict(additional_properties=['description', 'se-version']),
-             ['object-uri', 'name', 'status', 'description', 'se-version']),
+             ('object-uri', 'name', 'status', 'description', 'se-version')),
             (dict(additional_properties=['ssc-host-name']),
-             ['object-uri', 'name', 'status', 'ssc-host-name']
+             ('object-uri', 'name', 'status', 'ssc-host-name')
              # ssc-host-name is not on every partition
              ),
         ]
     )
     def test_pm_list_add_props(
-            self, list_kwargs, prop_names):
+            self, both_partitions, list_kwargs, prop_names):
         """
         Test PartitionManager.list() with additional_properties.
         """
 
-        # Add two faked partitions
-        faked_part1 = self.add_partition1()
-        faked_part2 = self.add_partition2()
-
-        partition_mgr = self.cpc.partitions
-
         # Execute the code to be tested
-        parts = partition_mgr.list(**list_kwargs)
-
-        exp_faked_parts = [faked_part1, faked_part2]
+        parts = self.partition_mgr.list(**list_kwargs)
 
-        assert_resources(parts, exp_faked_parts, prop_names)
+        assert_resources(parts, both_partitions, prop_names)
 
     @pytest.mark.parametrize(
-        "input_props, exp_prop_names, exp_exc", [
+        "input_props, exp_prop_names, exp_http_status, exp_reason", [
             ({},
              None,
-             HTTPError({'http-status': 400, 'reason': 5})),
+             400, 5),
             ({'description': 'fake description X'},
              None,
-             HTTPError({'http-status': 400, 'reason': 5})),
+             400, 5),
             ({'name': 'fake-part-x'},
              None,
-             HTTPError({'http-status': 400, 'reason': 5})),
+             400, 5),
             ({'name': 'fake-part-x',
               'initial-memory': 1024},
              None,
-             HTTPError({'http-status': 400, 'reason': 5})),
+             400, 5),
             ({'name': 'fake-part-x',
               'ifl-processors': 2,
               'initial-memory': 4096,
               'maximum-memory': 4096,
               'description': 'fake description X'},
-             ['object-uri', 'name', 'initial-memory', 'maximum-memory',
-              'ifl-processors', 'description'],
-             None),
+             ('object-uri', 'name', 'initial-memory', 'maximum-memory',
+              'ifl-processors', 'description'),
+             None, None),
             ({'name': 'fake-part-x',
               'ifl-processors': 2,
               'initial-memory': 4096,
@@ -322,10 +544,10 @@ class TestPartition:
               'boot-ftp-username': 'user',
               'boot-ftp-password': 'bla',
               'boot-ftp-insfile': 'ins'},
-             ['object-uri', 'name', 'initial-memory', 'maximum-memory',
+             ('object-uri', 'name', 'initial-memory', 'maximum-memory',
               'ifl-processors', 'boot-device', 'boot-ftp-host',
-              'boot-ftp-username', 'boot-ftp-insfile'],
-             None),
+              'boot-ftp-username', 'boot-ftp-insfile'),
+             None, None),
             ({'name': 'fake-part-x',
               'ifl-processors': 2,
               'initial-memory': 4096,
@@ -334,40 +556,41 @@ class TestPartition:
               'ssc-host-name': 'host',
               'ssc-master-userid': 'user',
               'ssc-master-pw': 'bla'},
-             ['object-uri', 'name', 'initial-memory', 'maximum-memory',
-              'ifl-processors', 'type', 'ssc-host-name', 'ssc-master-userid'],
-             None),
+             ('object-uri', 'name', 'initial-memory', 'maximum-memory',
+              'ifl-processors', 'type', 'ssc-host-name', 'ssc-master-userid'),
+             None, None),
         ]
     )
-    def test_pm_create(self, caplog, input_props, exp_prop_names, exp_exc):
+    def test_pm_create(
+            self, caplog, input_props, exp_prop_names, exp_http_status,
+            exp_reason):
         """Test PartitionManager.create()."""
 
-        logger_name = "zhmcclient.api"
-        caplog.set_level(logging.DEBUG, logger=logger_name)
+        if exp_http_status is not None:
 
-        partition_mgr = self.cpc.partitions
-
-        if exp_exc is not None:
-
-            with pytest.raises(exp_exc.__class__) as exc_info:
+            with pytest.raises(HTTPError) as exc_info:
 
                 # Execute the code to be tested
-                partition = partition_mgr.create(properties=input_props)
+                partition = self.partition_mgr.create(properties=input_props)
 
             exc = exc_info.value
-            if isinstance(exp_exc, HTTPError):
-                assert exc.http_status == exp_exc.http_status
-                assert exc.reason == exp_exc.reason
+            assert exc.http_status == exp_http_status
+            assert exc.reason == exp_reason
 
         else:
 
+            # The API call log record is checked only in the success case
+            logger_name = "zhmcclient.api"
+            caplog.set_level(logging.DEBUG, logger=logger_name)
+
             # Execute the code to be tested.
             # Note: the Partition object returned by Partition.create() has
             # the input properties plus 'object-uri'.
-            partition = partition_mgr.create(properties=input_props)
+            partition = self.partition_mgr.create(properties=input_props)
 
             # Get its API call log record
-            call_record = caplog.records[-2]
+            call_record = find_api_call_record(
+                caplog.records, 'PartitionManager.create()')
 
             # Check the resource for consistency within itself
             assert isinstance(partition, Partition)
@@ -388,8 +611,7 @@ class TestPartition:
 
             # Verify the API call log record for blanked-out properties.
             assert_blanked_in_message(
-                call_record.message, input_props,
-                ['boot-ftp-password', 'ssc-master-pw'])
+                call_record.message, input_props, BLANKED_PROPS)
 
     def test_pm_resource_object(self):
         """
@@ -398,12 +620,10 @@ class TestPartition:
         This test exists for historical reasons, and by now is covered by the
         test for BaseManager.resource_object().
         """
-        partition_mgr = self.cpc.partitions
-
         partition_oid = 'fake-partition-id42'
 
         # Execute the code to be tested
-        partition = partition_mgr.resource_object(partition_oid)
+        partition = self.partition_mgr.resource_object(partition_oid)
 
         partition_uri = "/api/partitions/" + partition_oid
 
@@ -417,66 +637,57 @@ class TestPartition:
     # TODO: Test for initial Partition attributes (nics, hbas,
     #       virtual_functions)
 
-    def test_partition_repr(self):
+    def test_partition_repr(self, faked_partition1):
         """Test Partition.__repr__()."""
 
-        # Add a faked partition
-        faked_partition = self.add_partition1()
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=faked_partition.name)
+        partition = self.get_partition(faked_partition1)
 
         # Execute the code to be tested
         repr_str = repr(partition)
 
         repr_str = repr_str.replace('\n', '\\n')
         # We check just the begin of the string:
-        assert re.match(
-            rf'^{partition.__class__.__name__}\s+at\s+'
-            rf'0x{id(partition):08x}\s+\(\\n.*',
-            repr_str)
+        m = PARTITION_REPR_PATTERN.match(repr_str)
+        assert m
+        assert m.group('cls') == partition.__class__.__name__
+        assert int(m.group('id'), 16) == id(partition)
 
     @pytest.mark.parametrize(
-        "initial_status, exp_exc", [
-            ('stopped', None),
-            ('terminated', HTTPError({'http-status': 409, 'reason': 1})),
-            ('starting', HTTPError({'http-status': 409, 'reason': 1})),
-            ('active', HTTPError({'http-status': 409, 'reason': 1})),
-            ('stopping', HTTPError({'http-status': 409, 'reason': 1})),
-            ('degraded', HTTPError({'http-status': 409, 'reason': 1})),
-            ('reservation-error',
-             HTTPError({'http-status': 409, 'reason': 1})),
-            ('paused', HTTPError({'http-status': 409, 'reason': 1})),
+        "initial_status, exp_http_status, exp_reason", [
+            ('stopped', None, None),
+            ('terminated', 409, 1),
+            ('starting', 409, 1),
+            ('active', 409, 1),
+            ('stopping', 409, 1),
+            ('degraded', 409, 1),
+            ('reservation-error', 409, 1),
+            ('paused', 409, 1),
         ]
     )
-    def test_partition_delete(self, initial_status, exp_exc):
+    def test_partition_delete(
+            self, faked_partition1, faked_partition2, initial_status,
+            exp_http_status, exp_reason):
         """Test Partition.delete()."""
-
-        # Add a faked partition to be tested and another one
-        faked_partition = self.add_partition1()
-        self.add_partition2()
+        # pylint: disable=unused-argument
 
         # Set the initial status of the faked partition
-        faked_partition.properties['status'] = initial_status
-
-        partition_mgr = self.cpc.partitions
+        faked_partition1.properties['status'] = initial_status
 
-        partition = partition_mgr.find(name=faked_partition.name)
+        partition = self.partition_mgr.find(name=faked_partition1.name)
 
-        if exp_exc is not None:
+        if exp_http_status is not None:
 
-            with pytest.raises(exp_exc.__class__) as exc_info:
+            with pytest.raises(HTTPError) as exc_info:
 
                 # Execute the code to be tested
                 partition.delete()
 
             exc = exc_info.value
-            if isinstance(exp_exc, HTTPError):
-                assert exc.http_status == exp_exc.http_status
-                assert exc.reason == exp_exc.reason
+            assert exc.http_status == exp_http_status
+            assert exc.reason == exp_reason
 
             # Check that the partition still exists
-            partition_mgr.find(name=faked_partition.name)
+            self.partition_mgr.find(name=faked_partition1.name)
 
         else:
 
@@ -485,15 +696,14 @@ class TestPartition:
 
             # Check that the partition no longer exists
             with pytest.raises(NotFound) as exc_info:
-                partition_mgr.find(name=faked_partition.name)
+                self.partition_mgr.find(name=faked_partition1.name)
 
-    def test_partition_delete_create_same_name(self):
+    def test_partition_delete_create_same_name(
+            self, faked_partition1, faked_partition2):
         """Test Partition.delete() followed by create() with same name."""
+        # pylint: disable=unused-argument
 
-        # Add a faked partition to be tested and another one
-        faked_partition = self.add_partition1()
-        partition_name = faked_partition.name
-        self.add_partition2()
+        partition_name = faked_partition1.name
 
         # Construct the input properties for a third partition
         part3_props = {
@@ -505,23 +715,22 @@ class TestPartition:
         }
 
         # Set the initial status of the faked partition
-        faked_partition.properties['status'] = 'stopped'  # deletable
+        faked_partition1.properties['status'] = 'stopped'  # deletable
 
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=partition_name)
+        partition = self.partition_mgr.find(name=partition_name)
 
         # Execute the deletion code to be tested.
         partition.delete()
 
         # Check that the partition no longer exists
         with pytest.raises(NotFound):
-            partition_mgr.find(name=partition_name)
+            self.partition_mgr.find(name=partition_name)
 
         # Execute the creation code to be tested.
-        partition_mgr.create(part3_props)
+        self.partition_mgr.create(part3_props)
 
         # Check that the partition exists again under that name
-        partition3 = partition_mgr.find(name=partition_name)
+        partition3 = self.partition_mgr.find(name=partition_name)
         description = partition3.get_property('description')
         assert description == 'Third partition'
 
@@ -533,7 +742,7 @@ class TestPartition:
             'fake-feature1',
             None,
             ValueError,
-            "Firmware features are not supported"
+            FEATURES_NOT_SUPPORTED_PATTERN
         ),
         (
             "Partition with firmware feature support but no features",
@@ -542,25 +751,25 @@ class TestPartition:
             'fake-feature1',
             None,
             ValueError,
-            "Firmware feature fake-feature1 is not available"
+            FEATURE1_NOT_AVAILABLE_PATTERN
         ),
         (
             "Tested firmware feature not available (one other feature avail)",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
+                FEATURE_FOO_ENABLED,
             ],
             'fake-feature1',
             None,
             ValueError,
-            "Firmware feature fake-feature1 is not available"
+            FEATURE1_NOT_AVAILABLE_PATTERN
         ),
         (
             "Tested firmware feature available and disabled",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
-                dict(name='fake-feature1', state=False),
+                FEATURE_FOO_ENABLED,
+                FEATURE1_DISABLED,
             ],
             'fake-feature1',
             False,
@@ -571,8 +780,8 @@ class TestPartition:
             "Tested firmware feature available and enabled",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
-                dict(name='fake-feature1', state=True),
+                FEATURE_FOO_ENABLED,
+                FEATURE1_ENABLED,
             ],
             'fake-feature1',
             True,
@@ -582,29 +791,19 @@ class TestPartition:
     ]
 
     @pytest.mark.parametrize(
-        "desc, partition_name, available_features, feature_name, "
-        "exp_feature_enabled, exp_exc_type, exp_exc_msg",
-        FEATURE_ENABLED_TESTCASES
+        "desc, faked_partition, available_features, feature_name, "
+        "exp_feature_enabled, exp_exc_type, exp_exc_pattern",
+        FEATURE_ENABLED_TESTCASES,
+        indirect=['faked_partition'],
+        ids=[tc[0] for tc in FEATURE_ENABLED_TESTCASES]
     )
     def test_partition_feature_enabled(
-            self, desc, partition_name, available_features, feature_name,
-            exp_feature_enabled, exp_exc_type, exp_exc_msg):
-        # pylint: disable=unused-argument
+            self, feature_partition, desc, feature_name, exp_feature_enabled,
+            exp_exc_type, exp_exc_pattern):
+        # pylint: disable=unused-argument,no-self-use
         """Test Partition.feature_enabled() (deprecated)."""
 
-        # Add a faked Partition
-        faked_partition = self.add_partition(partition_name)
-
-        # Set up the firmware feature list
-        if available_features is not None:
-            faked_partition.properties['available-features-list'] = \
-                available_features
-        else:
-            if 'available-features-list' in faked_partition.properties:
-                del faked_partition.properties['available-features-list']
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=partition_name)
+        partition = feature_partition
 
         if exp_exc_type:
             with pytest.raises(exp_exc_type) as exc_info:
@@ -614,7 +813,7 @@ class TestPartition:
 
             exc = exc_info.value
             assert isinstance(exc, exp_exc_type)
-            assert re.search(exp_exc_msg, str(exc))
+            assert exp_exc_pattern.search(str(exc))
 
         else:
 
@@ -646,7 +845,7 @@ class TestPartition:
             "Tested firmware feature not available (one other feature avail)",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
+                FEATURE_FOO_ENABLED,
             ],
             'fake-feature1',
             False,
@@ -657,8 +856,8 @@ class TestPartition:
             "Tested firmware feature available and disabled",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
-                dict(name='fake-feature1', state=False),
+                FEATURE_FOO_ENABLED,
+                FEATURE1_DISABLED,
             ],
             'fake-feature1',
             False,
@@ -669,8 +868,8 @@ class TestPartition:
             "Tested firmware feature available and enabled",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
-                dict(name='fake-feature1', state=True),
+                FEATURE_FOO_ENABLED,
+                FEATURE1_ENABLED,
             ],
             'fake-feature1',
             True,
@@ -680,29 +879,19 @@ class TestPartition:
     ]
 
     @pytest.mark.parametrize(
-        "desc, partition_name, available_features, feature_name, "
-        "exp_feature_enabled, exp_exc_type, exp_exc_msg",
-        FIRMWARE_FEATURE_ENABLED_TESTCASES
+        "desc, faked_partition, available_features, feature_name, "
+        "exp_feature_enabled, exp_exc_type, exp_exc_pattern",
+        FIRMWARE_FEATURE_ENABLED_TESTCASES,
+        indirect=['faked_partition'],
+        ids=[tc[0] for tc in FIRMWARE_FEATURE_ENABLED_TESTCASES]
     )
     def test_partition_firmware_feature_enabled(
-            self, desc, partition_name, available_features, feature_name,
-            exp_feature_enabled, exp_exc_type, exp_exc_msg):
-        # pylint: disable=unused-argument
+            self, feature_partition, desc, feature_name, exp_feature_enabled,
+            exp_exc_type, exp_exc_pattern):
+        # pylint: disable=unused-argument,no-self-use
         """Test Partition.firmware_feature_enabled()."""
 
-        # Add a faked Partition
-        faked_partition = self.add_partition(partition_name)
-
-        # Set up the firmware feature list
-        if available_features is not None:
-            faked_partition.properties['available-features-list'] = \
-                available_features
-        else:
-            if 'available-features-list' in faked_partition.properties:
-                del faked_partition.properties['available-features-list']
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=partition_name)
+        partition = feature_partition
 
         if exp_exc_type:
             with pytest.raises(exp_exc_type) as exc_info:
@@ -712,7 +901,7 @@ class TestPartition:
 
             exc = exc_info.value
             assert isinstance(exc, exp_exc_type)
-            assert re.search(exp_exc_msg, str(exc))
+            assert exp_exc_pattern.search(str(exc))
 
         else:
 
@@ -728,7 +917,7 @@ class TestPartition:
             PART1_NAME,
             None,
             ValueError,
-            "Firmware features are not supported"
+            FEATURES_NOT_SUPPORTED_PATTERN
         ),
         (
             "Partition with firmware feature support but no features",
@@ -741,7 +930,7 @@ class TestPartition:
             "Partition with one enabled firmware feature",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
+                FEATURE_FOO_ENABLED,
             ],
             None,
             None
@@ -750,8 +939,8 @@ class TestPartition:
             "Partition with one enabled and one disabled firmware feature",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
-                dict(name='fake-feature-bar', state=False),
+                FEATURE_FOO_ENABLED,
+                FEATURE_BAR_DISABLED,
             ],
             None,
             None
@@ -759,31 +948,22 @@ class TestPartition:
     ]
 
     @pytest.mark.parametrize(
-        "desc, partition_name, available_features, exp_exc_type, exp_exc_msg",
-        FEATURE_INFO_TESTCASES
+        "desc, faked_partition, available_features, exp_exc_type, "
+        "exp_exc_pattern",
+        FEATURE_INFO_TESTCASES,
+        indirect=['faked_partition'],
+        ids=[tc[0] for tc in FEATURE_INFO_TESTCASES]
     )
     def test_partition_feature_info(
-            self, desc, partition_name, available_features, exp_exc_type,
-            exp_exc_msg):
-        # pylint: disable=unused-argument
+            self, feature_partition, desc, available_features, exp_exc_type,
+            exp_exc_pattern):
+        # pylint: disable=unused-argument,no-self-use
         """Test Partition.feature_info()."""
 
-        # Add a faked Partition
-        faked_partition = self.add_partition(partition_name)
-
-        # Set up the firmware feature list
-        if available_features is not None:
-            faked_partition.properties['available-features-list'] = \
-                available_features
-        else:
-            if 'available-features-list' in faked_partition.properties:
-                del faked_partition.properties['available-features-list']
+        partition = feature_partition
 
         exp_features = available_features
 
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=partition_name)
-
         if exp_exc_type:
             with pytest.raises(exp_exc_type) as exc_info:
 
@@ -792,7 +972,7 @@ class TestPartition:
 
             exc = exc_info.value
             assert isinstance(exc, exp_exc_type)
-            assert re.search(exp_exc_msg, str(exc))
+            assert exp_exc_pattern.search(str(exc))
 
         else:
 
@@ -822,7 +1002,7 @@ class TestPartition:
             "Partition with one enabled firmware feature",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
+                FEATURE_FOO_ENABLED,
             ],
             ['fake-feature-foo'],
             None,
@@ -832,8 +1012,8 @@ class TestPartition:
             "Partition with one enabled and one disabled firmware feature",
             PART3_NAME,
             [
-                dict(name='fake-feature-foo', state=True),
-                dict(name='fake-feature-bar', state=False),
+                FEATURE_FOO_ENABLED,
+                FEATURE_BAR_DISABLED,
             ],
             ['fake-feature-foo'],
             None,
@@ -842,29 +1022,19 @@ class TestPartition:
     ]
 
     @pytest.mark.parametrize(
-        "desc, partition_name, available_features, exp_feature_names, "
-        "exp_exc_type, exp_exc_msg",
-        LIST_FIRMWARE_FEATURES_TESTCASES
+        "desc, faked_partition, available_features, exp_feature_names, "
+        "exp_exc_type, exp_exc_pattern",
+        LIST_FIRMWARE_FEATURES_TESTCASES,
+        indirect=['faked_partition'],
+        ids=[tc[0] for tc in LIST_FIRMWARE_FEATURES_TESTCASES]
     )
     def test_partition_list_firmware_features(
-            self, desc, partition_name, available_features, exp_feature_names,
-            exp_exc_type, exp_exc_msg):
-        # pylint: disable=unused-argument
+            self, feature_partition, desc, exp_feature_names, exp_exc_type,
+            exp_exc_pattern):
+        # pylint: disable=unused-argument,no-self-use
         """Test Partition.list_firmware_features()."""
 
-        # Add a faked Partition
-        faked_partition = self.add_partition(partition_name)
-
-        # Set up the firmware feature list
-        if available_features is not None:
-            faked_partition.properties['available-features-list'] = \
-                available_features
-        else:
-            if 'available-features-list' in faked_partition.properties:
-                del faked_partition.properties['available-features-list']
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=partition_name)
+        partition = feature_partition
 
         if exp_exc_type:
             with pytest.raises(exp_exc_type) as exc_info:
@@ -874,7 +1044,7 @@ class TestPartition:
 
             exc = exc_info.value
             assert isinstance(exc, exp_exc_type)
-            assert re.search(exp_exc_msg, str(exc))
+            assert exp_exc_pattern.search(str(exc))
 
         else:
 
@@ -883,105 +1053,124 @@ class TestPartition:
 
             assert set(act_feature_names) == set(exp_feature_names)
 
+    UPDATE_PROPERTIES_TESTCASES = [
+        # Each testcase is a tuple of:
+        # - desc (str): Short description of the testcase.
+        # - input_props (dict): Properties to be updated.
+        ('empty',
+         {}),
+        ('descr',
+         {'description': 'New partition description'}),
+        ('mem-descr',
+         {'initial-memory': 512,
+          'description': 'New partition description'}),
+        ('autogen-id',
+         {'autogenerate-partition-id': True,
+          'partition-id': None}),
+        ('boot-ftp',
+         {'boot-device': 'none',
+          'boot-ftp-host': None,
+          'boot-ftp-username': None,
+          'boot-ftp-password': None,
+          'boot-ftp-insfile': None}),
+        ('boot-net',
+         {'boot-device': 'none',
+          'boot-network-device': None}),
+        ('boot-rm',
+         {'boot-device': 'none',
+          'boot-removable-media': None,
+          'boot-removable-media-type': None}),
+        ('boot-stor',
+         {'boot-device': 'none',
+          'boot-storage-device': None,
+          'boot-logical-unit-number': None,
+          'boot-world-wide-port-name': None}),
+        ('boot-iso',
+         {'boot-device': 'none',
+          'boot-iso-image-name': None,
+          'boot-iso-insfile': None}),
+        ('ssc',
+         {'ssc-ipv4-gateway': None,
+          'ssc-ipv6-gateway': None,
+          'ssc-master-userid': None,
+          'ssc-master-pw': None}),
+    ]
+
     @pytest.mark.parametrize(
-        "partition_name", [
+        "faked_partition", [
             PART1_NAME,
             PART2_NAME,
-        ]
-    )
-    @pytest.mark.parametrize(
-        "input_props", [
-            {},
-            {'description': 'New partition description'},
-            {'initial-memory': 512,
-             'description': 'New partition description'},
-            {'autogenerate-partition-id': True,
-             'partition-id': None},
-            {'boot-device': 'none',
-             'boot-ftp-host': None,
-             'boot-ftp-username': None,
-             'boot-ftp-password': None,
-             'boot-ftp-insfile': None},
-            {'boot-device': 'none',
-             'boot-network-device': None},
-            {'boot-device': 'none',
-             'boot-removable-media': None,
-             'boot-removable-media-type': None},
-            {'boot-device': 'none',
-             'boot-storage-device': None,
-             'boot-logical-unit-number': None,
-             'boot-world-wide-port-name': None},
-            {'boot-device': 'none',
-             'boot-iso-image-name': None,
-             'boot-iso-insfile': None},
-            {'ssc-ipv4-gateway': None,
-             'ssc-ipv6-gateway': None,
-             'ssc-master-userid': None,
-             'ssc-master-pw': None},
-        ]
+        ],
+        indirect=True
     )
-    def test_partition_update_properties(
-            self, caplog, input_props, partition_name):
-        """Test Partition.update_properties()."""
+    def test_partition_update_properties(self, faked_partition, caplog):
+        """
+        Test Partition.update_properties().
 
-        logger_name = "zhmcclient.api"
-        caplog.set_level(logging.DEBUG, logger=logger_name)
+        The testcases in UPDATE_PROPERTIES_TESTCASES are run in sequence on
+        the same partition, whereby the faked partition is reset to its
+        initial properties before each testcase.
+        """
 
-        # Add faked partitions
-        self.add_partition1()
-        self.add_partition2()
+        partition = self.partition_mgr.find(name=faked_partition.name)
 
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=partition_name)
+        initial_faked_properties = dict(faked_partition.properties)
 
-        partition.pull_full_properties()
-        saved_properties = copy.deepcopy(partition.properties)
+        for desc, input_props in self.UPDATE_PROPERTIES_TESTCASES:
 
-        # Execute the code to be tested
-        partition.update_properties(properties=input_props)
-
-        # Get its API call log record
-        call_record = caplog.records[-2]
-
-        # Verify that the resource object already reflects the property
-        # updates.
-        for prop_name in saved_properties:
-            if prop_name in input_props:
-                exp_prop_value = input_props[prop_name]
-            else:
-                exp_prop_value = saved_properties[prop_name]
-            assert prop_name in partition.properties
-            prop_value = partition.properties[prop_name]
-            assert prop_value == exp_prop_value
-
-        # Refresh the resource object and verify that the resource object
-        # still reflects the property updates.
-        partition.pull_full_properties()
-        for prop_name in saved_properties:
-            if prop_name in input_props:
-                exp_prop_value = input_props[prop_name]
-            else:
-                exp_prop_value = saved_properties[prop_name]
-            assert prop_name in partition.properties
-            prop_value = partition.properties[prop_name]
-            assert prop_value == exp_prop_value
-
-        # Verify the API call log record for blanked-out properties.
-        assert_blanked_in_message(
-            call_record.message, input_props,
-            ['boot-ftp-password', 'ssc-master-pw'])
-
-    def test_partition_update_name(self):
+            # Reset the faked partition to its initial properties
+            faked_partition.properties.clear()
+            faked_partition.properties.update(initial_faked_properties)
+            caplog.clear()
+
+            partition.pull_full_properties()
+            # The property values are only replaced, never modified in place,
+            # so a shallow copy is sufficient.
+            saved_properties = dict(partition.properties)
+
+            # The expected property values after the update
+            exp_properties = dict(saved_properties)
+            exp_properties.update(
+                (k, v) for k, v in input_props.items()
+                if k in saved_properties)
+
+            # The API call log record is checked only for the tested call
+            with caplog.at_level(logging.DEBUG, logger="zhmcclient.api"):
+
+                # Execute the code to be tested
+                partition.update_properties(properties=input_props)
+
+            # Get its API call log record
+            call_record = find_api_call_record(
+                caplog.records, 'Partition.update_properties()')
+
+            # Verify that the resource object already reflects the property
+            # updates.
+            for prop_name, exp_prop_value in exp_properties.items():
+                assert partition.properties[prop_name] == exp_prop_value, (
+                    f"Testcase {desc!r}: Unexpected value for property "
+                    f"{prop_name!r} before refresh")
+
+            # Refresh the resource object and verify that the resource object
+            # still reflects the property updates.
+            partition.pull_full_properties()
+            for prop_name, exp_prop_value in exp_properties.items():
+                assert partition.properties[prop_name] == exp_prop_value, (
+                    f"Testcase {desc!r}: Unexpected value for property "
+                    f"{prop_name!r} after refresh")
+
+            # Verify the API call log record for blanked-out properties.
+            assert_blanked_in_message(
+                call_record.message, input_props, BLANKED_PROPS)
+
+    def test_partition_update_name(self, faked_partition1):
         """
         Test Partition.update_properties() with 'name' property.
         """
 
-        # Add a faked partition
-        faked_partition = self.add_partition1()
-        partition_name = faked_partition.name
+        partition_name = faked_partition1.name
 
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=partition_name)
+        partition = self.partition_mgr.find(name=partition_name)
 
         new_partition_name = "new-" + partition_name
 
@@ -990,140 +1179,117 @@ class TestPartition:
 
         # Verify that the resource is no longer found by its old name, using
         # list() (this does not use the name-to-URI cache).
-        partitions_list = partition_mgr.list(
+        partitions_list = self.partition_mgr.list(
             filter_args=dict(name=partition_name))
         assert len(partitions_list) == 0
 
         # Verify that the resource is no longer found by its old name, using
         # find() (this uses the name-to-URI cache).
         with pytest.raises(NotFound):
-            partition_mgr.find(name=partition_name)
+            self.partition_mgr.find(name=partition_name)
 
         # Verify that the resource object already reflects the update, even
         # though it has not been refreshed yet.
         assert partition.properties['name'] == new_partition_name
 
-        # Refresh the resource object and verify that it still reflects the
-        # update.
-        partition.pull_full_properties()
-        assert partition.properties['name'] == new_partition_name
-
         # Verify that the resource can be found by its new name, using find()
-        new_partition_find = partition_mgr.find(name=new_partition_name)
+        new_partition_find = self.partition_mgr.find(name=new_partition_name)
         assert new_partition_find.properties['name'] == new_partition_name
 
         # Verify that the resource can be found by its new name, using list()
-        new_partitions_list = partition_mgr.list(
+        new_partitions_list = self.partition_mgr.list(
             filter_args=dict(name=new_partition_name))
         assert len(new_partitions_list) == 1
         new_partition_list = new_partitions_list[0]
         assert new_partition_list.properties['name'] == new_partition_name
 
+    LIFECYCLE_SUCCESS_TESTCASES = [
+        # Each testcase is a tuple of:
+        # - op (str): Name of the Partition method to be tested.
+        # - initial_status (str): Initial status of the faked partition.
+        # - exp_status (str): Expected status after the operation.
+        ('start', 'stopped', 'active'),
+        ('stop', 'terminated', 'stopped'),
+        ('stop', 'active', 'stopped'),
+        ('stop', 'paused', 'stopped'),
+    ]
+
     @pytest.mark.parametrize(
-        "initial_status, exp_exc", [
-            ('stopped', None),
-            ('terminated', HTTPError({'http-status': 409, 'reason': 1})),
-            ('starting', HTTPError({'http-status': 409, 'reason': 1})),
-            ('active', HTTPError({'http-status': 409, 'reason': 1})),
-            ('stopping', HTTPError({'http-status': 409, 'reason': 1})),
-            ('degraded', HTTPError({'http-status': 409, 'reason': 1})),
-            ('reservation-error',
-             HTTPError({'http-status': 409, 'reason': 1})),
-            ('paused', HTTPError({'http-status': 409, 'reason': 1})),
-        ]
+        "op, initial_status, exp_status",
+        LIFECYCLE_SUCCESS_TESTCASES,
+        ids=[f"{tc[0]}-{tc[1]}" for tc in LIFECYCLE_SUCCESS_TESTCASES]
     )
-    def test_partition_start(self, initial_status, exp_exc):
-        """Test Partition.start()."""
-
-        # Add a faked partition
-        faked_partition = self.add_partition1()
+    def test_partition_lifecycle(
+            self, faked_partition1, op, initial_status, exp_status):
+        """Test successful Partition.start() and Partition.stop()."""
 
         # Set the initial status of the faked partition
-        faked_partition.properties['status'] = initial_status
+        faked_partition1.properties['status'] = initial_status
 
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=faked_partition.name)
-
-        if exp_exc is not None:
-
-            with pytest.raises(exp_exc.__class__) as exc_info:
+        partition = self.get_partition(faked_partition1)
 
-                # Execute the code to be tested
-                partition.start()
-
-            exc = exc_info.value
-            if isinstance(exp_exc, HTTPError):
-                assert exc.http_status == exp_exc.http_status
-                assert exc.reason == exp_exc.reason
-
-        else:
-
-            # Execute the code to be tested.
-            ret = partition.start()
+        # Execute the code to be tested.
+        ret = getattr(partition, op)()
 
-            assert ret == {}
+        assert ret == {}
 
-            partition.pull_full_properties()
-            status = partition.get_property('status')
-            assert status == 'active'
+        partition.pull_full_properties()
+        status = partition.get_property('status')
+        assert status == exp_status
+
+    LIFECYCLE_CONFLICT_TESTCASES = [
+        # Each testcase is a tuple of:
+        # - op (str): Name of the Partition method to be tested.
+        # - initial_status (str): Initial status of the faked partition, in
+        #   which the operation is not permitted.
+        # - exp_http_status (int): Expected HTTP status of the HTTPError.
+        # - exp_reason (int): Expected reason code of the HTTPError.
+        ('start', 'terminated', 409, 1),
+        ('start', 'starting', 409, 1),
+        ('start', 'active', 409, 1),
+        ('start', 'stopping', 409, 1),
+        ('start', 'degraded', 409, 1),
+        ('start', 'reservation-error', 409, 1),
+        ('start', 'paused', 409, 1),
+        ('stop', 'stopped', 409, 1),
+        ('stop', 'starting', 409, 1),
+        ('stop', 'stopping', 409, 1),
+        ('stop', 'degraded', 409, 1),
+        ('stop', 'reservation-error', 409, 1),
+    ]
 
     @pytest.mark.parametrize(
-        "initial_status, exp_exc", [
-            ('stopped', HTTPError({'http-status': 409, 'reason': 1})),
-            ('terminated', None),
-            ('starting', HTTPError({'http-status': 409, 'reason': 1})),
-            ('active', None),
-            ('stopping', HTTPError({'http-status': 409, 'reason': 1})),
-            ('degraded', HTTPError({'http-status': 409, 'reason': 1})),
-            ('reservation-error',
-             HTTPError({'http-status': 409, 'reason': 1})),
-            ('paused', None),
-        ]
+        "op, initial_status, exp_http_status, exp_reason",
+        LIFECYCLE_CONFLICT_TESTCASES,
+        ids=[f"{tc[0]}-{tc[1]}" for tc in LIFECYCLE_CONFLICT_TESTCASES]
     )
-    def test_partition_stop(self, initial_status, exp_exc):
-        """Test Partition.stop()."""
-
-        # Add a faked partition
-        faked_partition = self.add_partition1()
+    def test_partition_lifecycle_conflict(
+            self, faked_partition1, op, initial_status, exp_http_status,
+            exp_reason):
+        """
+        Test Partition.start() and Partition.stop() in a status in which they
+        are not permitted.
+        """
 
         # Set the initial status of the faked partition
-        faked_partition.properties['status'] = initial_status
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=faked_partition.name)
-
-        if exp_exc is not None:
+        faked_partition1.properties['status'] = initial_status
 
-            with pytest.raises(exp_exc.__class__) as exc_info:
+        partition = self.get_partition(faked_partition1)
 
-                # Execute the code to be tested
-                partition.stop()
-
-            exc = exc_info.value
-            if isinstance(exp_exc, HTTPError):
-                assert exc.http_status == exp_exc.http_status
-                assert exc.reason == exp_exc.reason
+        with pytest.raises(HTTPError) as exc_info:
 
-        else:
-
-            # Execute the code to be tested.
-            ret = partition.stop()
-
-            assert ret == {}
+            # Execute the code to be tested
+            getattr(partition, op)()
 
-            partition.pull_full_properties()
-            status = partition.get_property('status')
-            assert status == 'stopped'
+        exc = exc_info.value
+        assert exc.http_status == exp_http_status
+        assert exc.reason == exp_reason
 
-    # TODO: Re-enable test_partition_dump_partition() once supported in hdlr
-    def xtest_partition_dump_partition(self):
+    @pytest.mark.skip("TODO: Re-enable once supported in hdlr")
+    def test_partition_dump_partition(self, faked_partition1):
         """Test Partition.dump_partition()."""
 
-        # Add a faked partition
-        faked_partition = self.add_partition1()
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=faked_partition.name)
+        partition = self.get_partition(faked_partition1)
 
         parameters = {
             'dump-load-hba-uri': 'fake-hba-uri',
@@ -1136,14 +1302,10 @@ class TestPartition:
 
         assert ret == {}
 
-    def test_partition_start_dump_program(self):
+    def test_partition_start_dump_program(self, faked_partition1):
         """Test Partition.start_dump_program()."""
 
-        # Add a faked partition
-        faked_partition = self.add_partition1()
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=faked_partition.name)
+        partition = self.get_partition(faked_partition1)
 
         parameters = {
             'dump-program-type': 'storage',
@@ -1157,30 +1319,22 @@ class TestPartition:
 
         assert ret == {}
 
-    # TODO: Re-enable test_partition_psw_restart() once supported in hdlr
-    def xtest_partition_psw_restart(self):
+    @pytest.mark.skip("TODO: Re-enable once supported in hdlr")
+    def test_partition_psw_restart(self, faked_partition1):
         """Test Partition.psw_restart()."""
 
-        # Add a faked partition
-        faked_partition = self.add_partition1()
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=faked_partition.name)
+        partition = self.get_partition(faked_partition1)
 
         # Execute the code to be tested.
         ret = partition.psw_restart()
 
         assert ret == {}
 
-    # TODO: Re-enable test_partition_mount_iso_image() once supported in hdlr
-    def xtest_partition_mount_iso_image(self):
+    @pytest.mark.skip("TODO: Re-enable once supported in hdlr")
+    def test_partition_mount_iso_image(self, faked_partition1):
         """Test Partition.mount_iso_image()."""
 
-        # Add a faked partition
-        faked_partition = self.add_partition1()
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=faked_partition.name)
+        partition = self.get_partition(faked_partition1)
 
         # TODO: Add test case where a file-like object is passed as image
         image = b'fake-image-data'
@@ -1193,15 +1347,11 @@ class TestPartition:
 
         assert ret is None
 
-    # TODO: Re-enable test_partition_unmount_iso_image() once supported in hdlr
-    def xtest_partition_unmount_iso_image(self):
+    @pytest.mark.skip("TODO: Re-enable once supported in hdlr")
+    def test_partition_unmount_iso_image(self, faked_partition1):
         """Test Partition.unmount_iso_image()."""
 
-        # Add a faked partition
-        faked_partition = self.add_partition1()
-
-        partition_mgr = self.cpc.partitions
-        partition = partition_mgr.find(name=faked_partition.name)
+        partition = self.get_partition(faked_partition1)
 
         # Execute the code to be tested.
         ret = partition.unmount_iso_image()
@@ -1212,58 +1362,44 @@ class TestPartition:
         "filter_args, additional_props, exp_names", [
             ({'cpc-name': 'bad'},
              None,
-             []),
+             frozenset()),
             ({'cpc-name': CPC_NAME},
-             ['ifl-processors', 'maximum-memory'],
-             [PART1_NAME, PART2_NAME]),
+             ADDITIONAL_PROPS_CPU_MEM,
+             frozenset({PART1_NAME, PART2_NAME})),
             ({},
              None,
-             [PART1_NAME, PART2_NAME]),
+             frozenset({PART1_NAME, PART2_NAME})),
             (None,
              None,
-             [PART1_NAME, PART2_NAME]),
+             frozenset({PART1_NAME, PART2_NAME})),
             ({'name': PART1_NAME},
-             ['maximum-memory'],
-             [PART1_NAME]),
+             ADDITIONAL_PROPS_MEM,
+             frozenset({PART1_NAME})),
             ({'name': PART1_NAME, 'cpc-name': CPC_NAME},
              None,
-             [PART1_NAME]),
+             frozenset({PART1_NAME})),
             ({'name': PART1_NAME, 'cpc-name': 'bad'},
              None,
-             [])
+             frozenset())
         ]
     )
-    def test_console_list_permitted_partitions(self, filter_args,
-                                               additional_props, exp_names):
+    def test_console_list_permitted_partitions(
+            self, hmc_console, both_partitions, filter_args,
+            additional_props, exp_names):
         """Test Console.list_permitted_partitions() with filter_args."""
-
-        # Add two faked partitions
-        self.add_partition1()
-        self.add_partition2()
-
-        self.session.hmc.consoles.add({
-            'object-id': None,
-            # object-uri will be automatically set
-            'parent': None,
-            'class': 'console',
-            'name': 'fake-console1',
-            'description': 'Console #1',
-        })
-
-        console = self.client.consoles.console
+        # pylint: disable=unused-argument,redefined-outer-name,no-self-use
 
         # Execute the code to be tested
-        partitions = console.list_permitted_partitions(
+        partitions = hmc_console.list_permitted_partitions(
             filter_args=filter_args,
             additional_properties=additional_props)
 
         assert len(partitions) == len(exp_names)
-        if exp_names:
-            names = [p.properties['name'] for p in partitions]
-            assert set(names) == set(exp_names)
+        names = frozenset(p.properties['name'] for p in partitions)
+        assert names == exp_names
 
         for partition in partitions:
-            partition_props = dict(partition.properties)
+            partition_props = partition.properties
             for pname in LIST_PERMITTED_PARTITIONS_PROPS:
                 assert pname in partition_props, (
                     f"Property {pname!r} missing from returned partition "